@@ -3,11 +3,17 @@
 
 
 # import needed libraries
+import numpy as np  # type: ignore
 import os
 import pandas as pd  # type: ignore
+import pyarrow as pa  # type: ignore
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from pandas import errors
+from pyarrow import csv as pacsv  # type: ignore
+from rapidfuzz import process  # type: ignore
+from rapidfuzz.distance import Levenshtein  # type: ignore
 from typing import Dict, List, Optional, Tuple
 
 from omop2obo.utils import *
@@ -21,6 +27,9 @@ class ConceptAnnotator(object):
         3 - Exact String Mapping to concept labels and/or synonyms
         4 - Similarity distance mapping
 
+    Steps 1-3 are run by clinical_concept_mapper. Levenshtein similarity mapping to concept labels and/or synonyms is
+    available separately through similarity_string_mapper.
+
     Attributes:
         clinical_data: A Pandas DataFrame containing clinical data.
         ontology_dictionary: A nested dictionary containing ontology data, where outer keys are ontology identifiers
@@ -32,8 +41,14 @@ class ConceptAnnotator(object):
         concept_strings: A list of column names containing concept-level labels and synonyms (optional).
         ancestor_codes: A list of column names containing ancestor concept-level codes (optional).
         ancestor_strings: A list of column names containing ancestor concept-level labels and synonyms (optional).
-        umls_cui_data: A Pandas DataFrame containing UMLS CUI data from MRCONSO.RRF.
-        umls_tui_data: A Pandas DataFrame containing UMLS CUI data from MRSTY.RRF.
+        ont_labels: A dictionary keyed by ontology URI with the label of that URI as values.
+        ont_dbxref_data: A Pandas DataFrame containing normalized ontology dbxref codes (CODE) and the ontology URI
+            each code maps to (DBXREF_URI).
+        ont_string_data: A Pandas DataFrame containing ontology URIs (STR_URI) indexed by their labels and synonyms.
+        umls_cui_data: A Pandas DataFrame containing UMLS CUI data from MRCONSO.RRF, indexed by CODE.
+        umls_code_cuis: A dictionary keyed by normalized source code with a list of the UMLS CUIs for that code as
+            values. It is built from umls_cui_data on the first call to umls_cui_lookup.
+        umls_tui_data: A Pandas DataFrame containing UMLS CUI data from MRSTY.RRF, indexed by CUI.
         source_code_map: A dictionary containing clinical vocabulary source code abbreviations.
         umls_double_merge: A bool specifying whether to merge UMLS SAB codes with OMOP source codes once or twice.
             Merging once will only align OMOP source codes to UMLS SAB, twice with take the CUIs from the first merge
@@ -94,9 +109,9 @@ class ConceptAnnotator(object):
         else:
             print('Loading Clinical Data')
             try:
-                self.clinical_data: pd.DataFrame = pd.read_csv(clinical_file, header=0, low_memory=False).astype(str)
-            except pd.errors.ParserError:
-                self.clinical_data = pd.read_csv(clinical_file, header=0, sep='\t', low_memory=False).astype(str)
+                self.clinical_data: pd.DataFrame = reads_string_data(clinical_file)
+            except pa.ArrowInvalid:
+                self.clinical_data = reads_string_data(clinical_file, delimiter='\t')
 
         # check primary key
         if not isinstance(primary_key, str):
@@ -142,11 +157,20 @@ class ConceptAnnotator(object):
             raise TypeError('ontology_dictionary must be type dict.')
         else:
             self.ont_dict: Dict = ontology_dictionary
+            # ontology data does not change between mapping levels, so build the merge-ready versions once
+            self.ont_labels: Dict = merge_dictionaries(self.ont_dict, 'label', reverse=True)
+            self.ont_dbxref_data: pd.DataFrame = stacks_dictionaries(self.ont_dict, ['dbxref'], ['CODE', 'DBXREF_URI'])
+            self.ont_dbxref_data['CODE'] = normalizes_source_codes(self.ont_dbxref_data['CODE'].to_frame(),
+                                                                   self.source_code_map)
+            self.ont_dbxref_data = self.ont_dbxref_data.drop_duplicates().astype({'CODE': 'category'})
+            ont_strings = stacks_dictionaries(self.ont_dict, ['label', 'synonym'], ['CODE', 'STR_URI'])
+            self.ont_string_data: pd.DataFrame = ont_strings.drop_duplicates().set_index('CODE')
 
         # check for UMLS MRCONSO file
         # assumption (line 154) currently filtering to only keep 'ENG' codes, remove this constraint if too specific
+        self.umls_code_cuis: Optional[Dict] = None
         if not umls_mrconso_file:
-            self.umls_data: Optional[pd.DataFrame] = None
+            self.umls_cui_data: Optional[pd.DataFrame] = None
         else:
             if not isinstance(umls_mrconso_file, str):
                 raise TypeError('umls_mrconso_file must be type str.')
@@ -156,17 +180,34 @@ class ConceptAnnotator(object):
                 raise TypeError('Input file: {} is empty'.format(umls_mrconso_file))
             else:
                 print('Loading UMLS MRCONSO Data')
-                headers = ['CUI', 'LANG', 'SAB', 'CODE']
-                self.umls_cui_data = pd.read_csv(umls_mrconso_file, sep='|', names=headers, low_memory=False,
-                                                 header=None, usecols=[0, 1, 11, 13]).drop_duplicates().astype(str)
-                # light filtering and tidying
-                df = self.umls_cui_data[(self.umls_cui_data.CODE != 'NOCODE') & (self.umls_cui_data.LANG == 'ENG')]
-                self.umls_cui_data = df[['CUI', 'SAB', 'CODE']].drop_duplicates()
-                self.umls_cui_data['CODE'] = self.umls_cui_data['SAB'] + ':' + self.umls_cui_data['CODE'].str.lower()
+                headers = ['CUI', 'LANG', 'TS', 'LUI', 'STT', 'SUI', 'ISPREF', 'AUI', 'SAUI', 'SCUI', 'SDUI', 'SAB',
+                           'TTY', 'CODE', 'STR', 'SRL', 'SUPPRESS', 'CVF', '']
+                dict_type = pa.dictionary(pa.int32(), pa.string())
+                convert = pacsv.ConvertOptions(include_columns=['CUI', 'LANG', 'SAB', 'CODE'],
+                                               column_types={'CUI': pa.string(), 'LANG': dict_type, 'SAB': dict_type,
+                                                             'CODE': pa.string()})
+                mrconso = pacsv.open_csv(umls_mrconso_file,
+                                         read_options=pacsv.ReadOptions(column_names=headers, block_size=1 << 27),
+                                         parse_options=pacsv.ParseOptions(delimiter='|', quote_char=False),
+                                         convert_options=convert)
+                # light filtering and tidying -- applied to each block so the full file is never held in memory
+                chunks = []
+                for batch in mrconso:
+                    df = batch.to_pandas()
+                    df = df[(df.CODE != 'NOCODE') & (df.LANG == 'ENG')]
+                    chunks.append(df[['CUI', 'SAB', 'CODE']].drop_duplicates())
+                self.umls_cui_data = pd.concat(chunks, ignore_index=True).drop_duplicates().astype({'SAB': 'category'})
+                self.umls_cui_data['CODE'] = self.umls_cui_data['SAB'].astype(str) + ':' + \
+                    self.umls_cui_data['CODE'].str.lower()
                 self.umls_cui_data['CODE'] = self.umls_cui_data['CODE'].apply(
                     lambda j: ':'.join(j.split(':')[1:]) if len(j.split(':')) > 2 else j)
                 self.umls_cui_data['CODE'] = normalizes_source_codes(self.umls_cui_data['CODE'].to_frame(),
                                                                      self.source_code_map)
+                # normalizing can collapse codes, so de-duplicate again to keep (CUI, SAB, CODE) rows unique
+                self.umls_cui_data = self.umls_cui_data.drop_duplicates(subset=['CUI', 'SAB', 'CODE'])
+                # factorize join keys and index on code once so merges in umls_cui_annotator reuse them
+                self.umls_cui_data = self.umls_cui_data.astype({'CUI': 'category', 'CODE': 'category'})
+                self.umls_cui_data = self.umls_cui_data.set_index('CODE', drop=False).sort_index()
 
         # check for UMLS MRSTY file
         if not umls_mrsty_file:
@@ -180,9 +221,38 @@ class ConceptAnnotator(object):
                 raise TypeError('Input file: {} is empty'.format(umls_mrsty_file))
             else:
                 print('Loading UMLS MRSTY Data')
-                headers = ['CUI', 'STY']
-                self.umls_tui_data = pd.read_csv(umls_mrsty_file, header=None, sep='|', names=headers,
-                                                 low_memory=False, usecols=[0, 3]).drop_duplicates().astype(str)
+                headers = ['CUI', 'TUI', 'STN', 'STY', 'ATUI', 'CVF', '']
+                convert = pacsv.ConvertOptions(include_columns=['CUI', 'STY'],
+                                               column_types={'CUI': pa.string(), 'STY': pa.string()})
+                mrsty = pacsv.read_csv(umls_mrsty_file, read_options=pacsv.ReadOptions(column_names=headers),
+                                       parse_options=pacsv.ParseOptions(delimiter='|', quote_char=False),
+                                       convert_options=convert)
+                self.umls_tui_data = mrsty.to_pandas().drop_duplicates()
+                # share cui categories with umls_cui_data, cuis not found there can never be merged
+                if self.umls_cui_data is not None:
+                    cui_type = self.umls_cui_data['CUI'].dtype
+                    self.umls_tui_data = self.umls_tui_data.astype({'CUI': cui_type}).dropna(subset=['CUI'])
+                self.umls_tui_data = self.umls_tui_data.set_index('CUI').sort_index()
+
+    def umls_cui_lookup(self, code: str) -> List:
+        """Method returns the UMLS CUIs for a single normalized source code (e.g. "snomed:418135005") from the
+        umls_code_cuis dictionary, which is built from umls_cui_data the first time the method is called.
+
+        Args:
+            code: A string containing a normalized source code.
+
+        Returns:
+            A list of UMLS CUIs for the code, which is empty if the code or the UMLS data are not available.
+        """
+
+        if self.umls_cui_data is None:
+            return []
+        if self.umls_code_cuis is None:
+            # hash codes to their cuis once so later code lookups do not need a merge
+            cui_groups = self.umls_cui_data.groupby(level='CODE', observed=True, sort=False)['CUI']
+            self.umls_code_cuis = cui_groups.agg(list).to_dict()
+
+        return self.umls_code_cuis.get(code, [])
 
     def umls_cui_annotator(self, data: pd.DataFrame, key: str, code_level: str) -> pd.DataFrame:
         """Method maps concepts in a clinical data file to UMLS concepts and semantic types from the umls_cui_data
@@ -205,20 +275,30 @@ class ConceptAnnotator(object):
 
         """
 
+        # only called when both umls files were loaded
+        assert self.umls_cui_data is not None and self.umls_tui_data is not None
+        umls_cui_data, umls_tui_data = self.umls_cui_data, self.umls_tui_data
+
         # reduce data to only those columns needed for merging
         clinical_ids = data[[key, code_level]].drop_duplicates()
+        clinical_ids[code_level] = clinical_ids[code_level].astype(umls_cui_data['CODE'].dtype)
 
-        # merge reduced clinical concepts with umls concepts
+        # merge reduced clinical concepts with umls concepts -- umls_cui_data is sorted on code, so the code merges
+        # binary search the sorted keys rather than hashing them
         if self.umls_double_merge is True:
             # merge 1 - align omop source codes to umls sabs
-            umls_cui_1 = clinical_ids.merge(self.umls_cui_data, how='inner', left_on=code_level, right_on='CODE')
+            umls_cui_1 = merges_sorted_keys(clinical_ids, code_level, umls_cui_data)
             # merge 2 - align umls cuis from merge 1 to cuis in full umls (this adds additional sabs not found in omop)
-            umls_cui_2 = umls_cui_1[[key, code_level, 'CUI']].merge(self.umls_cui_data, how='left', on='CUI')
-            umls_cui = pd.concat([umls_cui_1, umls_cui_2])
+            umls_cui_full = umls_cui_data[umls_cui_data['CUI'].isin(umls_cui_1['CUI'].unique())]
+            umls_cui_2 = umls_cui_1[[key, code_level, 'CUI']].merge(umls_cui_full, how='left', on='CUI')
+            umls_cui = pd.concat([umls_cui_1, umls_cui_2]).drop_duplicates()
         else:
-            umls_cui = clinical_ids.merge(self.umls_cui_data, how='inner', left_on=code_level, right_on='CODE')
+            umls_cui = merges_sorted_keys(clinical_ids, code_level, umls_cui_data)
 
-        umls_cui_semtype = umls_cui.merge(self.umls_tui_data, how='left', on='CUI').drop_duplicates()
+        umls_tui_data = umls_tui_data[umls_tui_data.index.isin(umls_cui['CUI'].unique())]
+        # umls_cui rows and (CUI, STY) pairs are unique, so the merged rows are unique without de-duplicating
+        umls_cui_semtype = umls_cui.merge(umls_tui_data, how='left', left_on='CUI', right_index=True)
+        umls_cui_semtype = umls_cui_semtype.reset_index(drop=True)
 
         # update column names
         umls_cui_semtype.columns = [key, code_level, 'UMLS_CUI', 'UMLS_SAB', 'UMLS_CODE', 'UMLS_SEM_TYPE']
@@ -250,27 +330,28 @@ class ConceptAnnotator(object):
         """
 
         col_lab = code_type.upper() + '_DBXREF_ONT_'  # column labels
-        ont_labels = merge_dictionaries(self.ont_dict, 'label', reverse=True)
-
-        # convert ontology dictionary to Pandas DataFrame
-        ont_df = pd.concat([pd.DataFrame(self.ont_dict[ont]['dbxref'].items(), columns=['CODE', col_lab + 'URI'])
-                            for ont in self.ont_dict.keys() if len(self.ont_dict[ont]['dbxref']) > 0])
-        # normalize source_code prefix values
-        ont_df['CODE'] = normalizes_source_codes(ont_df['CODE'].to_frame(), self.source_code_map)
-        # merge ontology data and clinical data and run ohdsi ananke approach to specifically pull umls ont mappings
+        ont_df = self.ont_dbxref_data
+
+        # ont_df is de-duplicated on load, so merged rows are unique once the clinical data are
+        data = data.drop_duplicates()
+        # join on the categorical codes of ont_df, codes not found in the ontologies become null and are not merged
+        data_codes = data.assign(CODE=data['CODE'].astype(ont_df['CODE'].dtype))
+        dbxrefs = data_codes.merge(ont_df, how='inner', on='CODE').astype({'CODE': str})
+        # run ohdsi ananke approach to specifically pull umls ont mappings
         if self.umls_cui_data is not None:
             dbxrefs = pd.concat(
-                [data.merge(ont_df, how='inner', on='CODE').drop_duplicates(),
-                 ohdsi_ananke(primary_key, list(self.ont_dict.keys()), ont_df.copy(), data, self.umls_cui_data.copy())]
+                [dbxrefs,
+                 ohdsi_ananke(primary_key, list(self.ont_dict.keys()), ont_df.copy(), data, self.umls_cui_data)]
             )
-        else:
-            dbxrefs = data.merge(ont_df, how='inner', on='CODE').drop_duplicates()
 
         # update content and labels
-        dbxrefs[col_lab + 'TYPE'] = dbxrefs[col_lab + 'URI'].apply(lambda x: x.split('/')[-1].split('_')[0])
-        dbxrefs[col_lab + 'LABEL'] = dbxrefs[col_lab + 'URI'].apply(lambda x: ont_labels[x])
+        dbxrefs = dbxrefs.rename(columns={'DBXREF_URI': col_lab + 'URI'})
+        ont_ids = dbxrefs[col_lab + 'URI'].str.rsplit('/', n=1).str[-1]
+        dbxrefs[col_lab + 'TYPE'] = ont_ids.str.split('_', n=1).str[0]
+        dbxrefs[col_lab + 'LABEL'] = dbxrefs[col_lab + 'URI'].map(self.ont_labels)
         # update evidence formatting --> EX: CONCEPTS_DBXREF_UMLS:C0008533
-        dbxrefs[col_lab + 'EVIDENCE'] = dbxrefs['CODE'].apply(lambda x: col_lab[0:-4] + x)
+        # ohdsi_ananke codes are umls cuis, which stay categorical when they are the only rows concatenated
+        dbxrefs[col_lab + 'EVIDENCE'] = col_lab[0:-4] + dbxrefs['CODE'].astype(str)
         # drop unneeded columns
         dbxrefs = dbxrefs[[primary_key] + [x for x in list(dbxrefs.columns) if x.startswith(col_lab[0:-4])]]
 
@@ -303,29 +384,175 @@ class ConceptAnnotator(object):
         """
 
         col_label = code_type.upper() + '_STR_ONT_'  # column labels
-        ont_labels = merge_dictionaries(self.ont_dict, 'label', reverse=True)
-        data['CODE'] = data['CODE'].apply(lambda x: x.lower())  # prepare clinical data
-
-        # prepare ontology data
-        ont_dfs = []
-        for str_col in ['label', 'synonym']:
-            combo_dict_df_label = pd.concat([pd.DataFrame(self.ont_dict[ont][str_col].items(),
-                                                          columns=['CODE', col_label + 'URI']) for ont in
-                                             self.ont_dict.keys()])
-
-            # merge ontology data and clinical data
-            str_data = data.merge(combo_dict_df_label, how='inner', on='CODE').drop_duplicates()
-            # update ontology data formatting
-            str_data[col_label + 'TYPE'] = str_data[col_label + 'URI'].apply(lambda x: x.split('/')[-1].split('_')[0])
-            str_data[col_label + 'LABEL'] = str_data[col_label + 'URI'].apply(lambda x: ont_labels[x])
-            # update evidence formatting --> EX: CONCEPT_SYNONYM:dic_in_newborn
-            aggregated_evidence = str_data['CODE'].apply(lambda x: x.replace(' ', '_'))
-            str_data[col_label + 'EVIDENCE'] = str_data['CODE_COLUMN'] + ':' + aggregated_evidence
-            # drop unneeded columns
-            str_data = str_data[[primary_key] + [x for x in list(str_data.columns) if x.startswith(col_label[0:-4])]]
-            ont_dfs.append(str_data.drop_duplicates())
-
-        return pd.concat(ont_dfs).drop_duplicates()
+        data['CODE'] = data['CODE'].str.lower()  # prepare clinical data
+
+        # merge ontology label and synonym data and clinical data
+        str_data = data.drop_duplicates().merge(self.ont_string_data, how='inner', left_on='CODE', right_index=True)
+        # update ontology data formatting
+        str_data = str_data.rename(columns={'STR_URI': col_label + 'URI'})
+        ont_ids = str_data[col_label + 'URI'].str.rsplit('/', n=1).str[-1]
+        str_data[col_label + 'TYPE'] = ont_ids.str.split('_', n=1).str[0]
+        str_data[col_label + 'LABEL'] = str_data[col_label + 'URI'].map(self.ont_labels)
+        # update evidence formatting --> EX: CONCEPT_SYNONYM:dic_in_newborn
+        aggregated_evidence = str_data['CODE'].str.replace(' ', '_', regex=False)
+        str_data[col_label + 'EVIDENCE'] = str_data['CODE_COLUMN'] + ':' + aggregated_evidence
+        # drop unneeded columns
+        str_data = str_data[[primary_key] + [x for x in list(str_data.columns) if x.startswith(col_label[0:-4])]]
+
+        return str_data.drop_duplicates()
+
+    def similarity_string_mapper(self, data: pd.DataFrame, primary_key: str, code_type: str,
+                                 threshold: float = 0.9) -> pd.DataFrame:
+        """Takes a stacked Pandas DataFrame and maps each clinical string to its most similar ontology label or
+        synonym, by normalized Levenshtein similarity. Scores are computed in blocks of clinical strings against all
+        ontology strings in a single batched call, which keeps the pairwise comparisons out of Python.
+
+            INPUT:
+                    CONCEPT_ID                             CODE      CODE_COLUMN
+                0      4331309      myocarditis due to infectious agent    CONCEPT_LABEL
+                1      4331309            infective myocarditis  CONCEPT_SYNONYM
+
+            OUTPUT:
+                      CONCEPT_ID   CONCEPT_SIM_ONT_URI   CONCEPT_SIM_ONT_TYPE   CONCEPT_SIM_ONT_LABEL
+                0        4331309                   URL                     HP    infectious myocarditis
+
+                            CONCEPT_SIM_ONT_EVIDENCE
+                0    CONCEPT_SYNONYM:infectious_myocarditis_0.952
+        Args:
+            data: A stacked Pandas DataFrame containing clinical strings (see INPUT above for an example).
+            primary_key: A string containing the name of the primary key (i.e. CONCEPT_ID).
+            code_type: A string containing the concept_level (i.e. concept or ancestor).
+            threshold: A float between 0 and 1 specifying the minimum similarity score for a match (default=0.9).
+
+        Returns:
+            sim_data: A Pandas DataFrame containing the results from similarity matching the ontology strings to the
+                clinical strings (see OUTPUT above for an example).
+        """
+
+        col_label = code_type.upper() + '_SIM_ONT_'  # column labels
+        data = data.assign(CODE=data['CODE'].str.lower()).drop_duplicates()
+        queries, choices = data['CODE'].unique(), self.ont_string_data.index.unique()
+        if len(choices) == 0:  # no ontology labels or synonyms to score against
+            return pd.DataFrame(columns=[primary_key] + [col_label + x for x in ['URI', 'TYPE', 'LABEL', 'EVIDENCE']])
+
+        # score clinical strings against ontology strings, blocks bound the size of the dense score matrix
+        block, matches = max(1, (1 << 25) // max(1, len(choices))), []
+        for i in range(0, len(queries), block):
+            scores = process.cdist(queries[i:i + block], choices, scorer=Levenshtein.normalized_similarity,
+                                   score_cutoff=threshold, workers=-1)
+            best = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(best)), best]
+            keep = best_scores >= threshold
+            matches.append(pd.DataFrame({'CODE': queries[i:i + block][keep], 'STR_MATCH': choices[best[keep]],
+                                         'SCORE': best_scores[keep]}))
+        match_data = pd.concat(matches) if len(matches) > 0 else pd.DataFrame(columns=['CODE', 'STR_MATCH', 'SCORE'])
+
+        # merge matches with clinical data and ontology data
+        sim_data = data.merge(match_data, how='inner', on='CODE')
+        sim_data = sim_data.merge(self.ont_string_data, how='inner', left_on='STR_MATCH', right_index=True)
+        # update ontology data formatting
+        sim_data = sim_data.rename(columns={'STR_URI': col_label + 'URI'})
+        ont_ids = sim_data[col_label + 'URI'].str.rsplit('/', n=1).str[-1]
+        sim_data[col_label + 'TYPE'] = ont_ids.str.split('_', n=1).str[0]
+        sim_data[col_label + 'LABEL'] = sim_data[col_label + 'URI'].map(self.ont_labels)
+        # update evidence formatting --> EX: CONCEPT_SYNONYM:infectious_myocarditis_0.952
+        matched_evidence = sim_data['STR_MATCH'].str.replace(' ', '_', regex=False)
+        scores = sim_data['SCORE'].astype(float).round(3).astype(str)
+        sim_data[col_label + 'EVIDENCE'] = sim_data['CODE_COLUMN'] + ':' + matched_evidence + '_' + scores
+        # drop unneeded columns
+        sim_data = sim_data[[primary_key] + [x for x in list(sim_data.columns) if x.startswith(col_label[0:-4])]]
+
+        return sim_data.drop_duplicates()
+
+    def concept_level_mapper(self, level: str, code_level: str, code_strings: Optional[List]) -> pd.DataFrame:
+        """Annotates a single level (i.e. concept or ancestor) of the clinical data. The following steps are completed
+        to derive the level's annotations:
+            1 - UMLS CUIs and semantics types to concept ids
+            2 - Ontology dbXRefs between concept ids and ontology ids
+            3 - Exact string matching concept labels and synonyms to ontology labels and synonyms
+            4 - Aggregating the results from steps 1-3 into a single Pandas DataFrame
+
+        Args:
+            level: A string containing the concept_level (i.e. concept or ancestor).
+            code_level: A string containing the name of the level's source code column (i.e. CONCEPT_SOURCE_CODE).
+            code_strings: A list of column names containing the level's labels and synonyms.
+
+        Returns:
+            level_map: A Pandas DataFrame containing the aggregated mapping results for the level.
+        """
+
+        # levels run concurrently, so each progress line is written in one call and prefixed with its level
+        def log(message: str) -> None:
+            print('{}: {}\n'.format(level, message), end='')
+
+        primary_key, data = self.primary_key, self.clinical_data.copy()
+        if level == 'ancestor' or any(x for x in data[code_level] if '|' in x):
+            data = column_splitter(data, primary_key, [code_level], '|')[[primary_key] + [code_level]]
+            data[code_level] = normalizes_source_codes(data[code_level].to_frame(), self.source_code_map)
+        else:
+            data[code_level] = normalizes_source_codes(data[code_level].to_frame(), self.source_code_map)
+
+        # STEP 1: UMLS CUI + SEMANTIC TYPE ANNOTATION
+        log('Performing UMLS CUI + Semantic Type Annotation')
+        if self.umls_cui_data is not None and self.umls_tui_data is not None:
+            umls_map = self.umls_cui_annotator(data.copy(), primary_key, code_level)
+            sub = [code_level, 'UMLS_CODE', 'UMLS_CUI']
+            data_stacked = data_frame_subsetter(umls_map[[primary_key] + sub], primary_key, sub)
+        else:
+            log('Did not provide MRCONSO and MRSTY Files -- Skipping UMLS Annotation Step')
+            umls_map, clinical_subset = None, data[[primary_key, code_level]]
+            data_stacked = data_frame_subsetter(clinical_subset, primary_key, [code_level])
+
+        # STEP 2 - DBXREF ANNOTATION
+        log('Performing DbXRef Annotation')
+        stacked_dbxref = self.dbxref_mapper(data_stacked.copy(), primary_key, level)
+        # files = 'resources/mappings/' + level + '_dbXRef_Mappings.csv'
+        # stacked_dbxref.to_csv(files, sep=',', index=False, header=True)
+
+        # STEP 3 - EXACT STRING MAPPING
+        log('Performing Exact String Mapping')
+        clinical_strings = self.clinical_data.copy()[[primary_key] + code_strings]  # type: ignore
+        split_strings = column_splitter(clinical_strings, primary_key, code_strings, '|')  # type: ignore
+        split_strings = split_strings[[primary_key] + code_strings]  # type: ignore
+        split_strings_stacked = data_frame_subsetter(split_strings, primary_key, code_strings)  # type: ignore
+        stacked_strings = self.exact_string_mapper(split_strings_stacked, primary_key, level)
+        # files_str = 'resources/mappings/' + level + '_String_Mappings.csv'
+        # stacked_strings.to_csv(files_str, sep=',', index=False, header=True)
+
+        # STEP 4 - COMBINE RESULTS
+        log('Aggregating Mapping Results')
+        # dbXRef annotations
+        if len(stacked_dbxref) != 0:
+            ont_type_column = [col for col in stacked_dbxref.columns if 'TYPE' in col][0]
+            dbxrefs = data_frame_grouper(stacked_dbxref.copy(), primary_key, ont_type_column,
+                                         aggregates_column_values)
+        else:
+            dbxrefs = None
+
+        # exact string annotations
+        if len(stacked_strings) != 0:
+            ont_type_column = [col for col in stacked_strings.columns if 'TYPE' in col][0]
+            strings = data_frame_grouper(stacked_strings.copy(), primary_key, ont_type_column,
+                                         aggregates_column_values)
+        else:
+            strings = None
+
+        # umls annotations
+        if umls_map is not None:
+            umls, agg_cols = umls_map[[primary_key, 'UMLS_CUI', 'UMLS_SEM_TYPE']], ['UMLS_CUI', 'UMLS_SEM_TYPE']
+            umls = aggregates_column_values(umls.copy(), primary_key, agg_cols, ' | ')
+            umls.columns = [primary_key] + [level.upper() + '_' + x for x in umls.columns if x != primary_key]
+        else:
+            umls = None
+
+        # combine annotations
+        dfs = [x for x in [dbxrefs, strings, umls] if x is not None]
+        if len(dfs) > 1:
+            level_map = reduce(lambda x, y: pd.merge(x, y, how='outer', on=primary_key), dfs)
+        else:
+            level_map = dfs[0]
+
+        return level_map
 
     def clinical_concept_mapper(self) -> pd.DataFrame:
         """This method serves as the main method for this class. it's purpose is to iterate over all relevant data in
@@ -343,8 +570,6 @@ class ConceptAnnotator(object):
                 the input ontologies and clinical data.
         """
 
-        level_maps = []
-
         if self.ancestor_codes is not None:
             levels = {'concept': {'codes': self.concept_codes, 'strings': self.concept_strings},
                       'ancestor': {'codes': self.ancestor_codes,
@@ -352,75 +577,11 @@ class ConceptAnnotator(object):
         else:
             levels = {'concept': {'codes': self.concept_codes, 'strings': self.concept_strings}}
 
-        for level in levels.keys():
-            print('\n*** Annotating Level: {}'.format(level))
-            primary_key, data = self.primary_key, self.clinical_data.copy()
-            code_level, code_strings = levels[level]['codes'][0], levels[level]['strings']  # type: ignore
-            if level == 'ancestor' or any(x for x in data[code_level] if '|' in x):
-                data = column_splitter(data, primary_key, [code_level], '|')[[primary_key] + [code_level]]
-                data[code_level] = normalizes_source_codes(data[code_level].to_frame(), self.source_code_map)
-            else:
-                data[code_level] = normalizes_source_codes(data[code_level].to_frame(), self.source_code_map)
-
-            # STEP 1: UMLS CUI + SEMANTIC TYPE ANNOTATION
-            print('Performing UMLS CUI + Semantic Type Annotation')
-            if self.umls_cui_data is not None and self.umls_tui_data is not None:
-                umls_map = self.umls_cui_annotator(data.copy(), primary_key, code_level)
-                sub = [code_level, 'UMLS_CODE', 'UMLS_CUI']
-                data_stacked = data_frame_subsetter(umls_map[[primary_key] + sub], primary_key, sub)
-            else:
-                print('Did not provide MRCONSO and MRSTY Files -- Skipping UMLS Annotation Step')
-                umls_map, clinical_subset = None, data[[primary_key, code_level]]
-                data_stacked = data_frame_subsetter(clinical_subset, primary_key, [code_level])
-
-            # STEP 2 - DBXREF ANNOTATION
-            print('Performing DbXRef Annotation')
-            stacked_dbxref = self.dbxref_mapper(data_stacked.copy(), primary_key, level)
-            # files = 'resources/mappings/' + level + '_dbXRef_Mappings.csv'
-            # stacked_dbxref.to_csv(files, sep=',', index=False, header=True)
-
-            # STEP 3 - EXACT STRING MAPPING
-            print('Performing Exact String Mapping')
-            clinical_strings = self.clinical_data.copy()[[primary_key] + code_strings]  # type: ignore
-            split_strings = column_splitter(clinical_strings, primary_key, code_strings, '|')  # type: ignore
-            split_strings = split_strings[[primary_key] + code_strings]  # type: ignore
-            split_strings_stacked = data_frame_subsetter(split_strings, primary_key, code_strings)  # type: ignore
-            stacked_strings = self.exact_string_mapper(split_strings_stacked, primary_key, level)
-            # files_str = 'resources/mappings/' + level + '_String_Mappings.csv'
-            # stacked_strings.to_csv(files_str, sep=',', index=False, header=True)
-
-            # STEP 4 - COMBINE RESULTS
-            print('Aggregating Mapping Results')
-            # dbXRef annotations
-            if len(stacked_dbxref) != 0:
-                ont_type_column = [col for col in stacked_dbxref.columns if 'TYPE' in col][0]
-                dbxrefs = data_frame_grouper(stacked_dbxref.copy(), primary_key, ont_type_column,
-                                             aggregates_column_values)
-            else:
-                dbxrefs = None
-
-            # exact string annotations
-            if len(stacked_strings) != 0:
-                ont_type_column = [col for col in stacked_strings.columns if 'TYPE' in col][0]
-                strings = data_frame_grouper(stacked_strings.copy(), primary_key, ont_type_column,
-                                             aggregates_column_values)
-            else:
-                strings = None
-
-            # umls annotations
-            if umls_map is not None:
-                umls, agg_cols = umls_map[[primary_key, 'UMLS_CUI', 'UMLS_SEM_TYPE']], ['UMLS_CUI', 'UMLS_SEM_TYPE']
-                umls = aggregates_column_values(umls.copy(), primary_key, agg_cols, ' | ')
-                umls.columns = [primary_key] + [level.upper() + '_' + x for x in umls.columns if x != primary_key]
-            else:
-                umls = None
-
-            # combine annotations
-            dfs = [x for x in [dbxrefs, strings, umls] if x is not None]
-            if len(dfs) > 1:
-                level_maps.append(reduce(lambda x, y: pd.merge(x, y, how='outer', on=primary_key), dfs))
-            else:
-                level_maps.append(dfs[0])
+        # levels are independent and only read the shared umls and ontology data, so annotate them concurrently
+        print('\n*** Annotating Levels: {}'.format(', '.join(levels.keys())))
+        with ThreadPoolExecutor(max_workers=len(levels)) as executor:
+            level_maps = list(executor.map(lambda x: self.concept_level_mapper(x, levels[x]['codes'][0],  # type: ignore
+                                                                               levels[x]['strings']), levels.keys()))
 
         # STEP 5 - COMBINE CONCEPT AND ANCESTOR DATA
         print('Combining Concept and Ancestor Maps')
@@ -87,9 +87,9 @@ class SimilarStringFinder(object):
         else:
             print('Loading Clinical Data')
             try:
-                self.clinical_data: pd.DataFrame = pd.read_csv(clinical_file, header=0, low_memory=False).astype(str)
+                self.clinical_data: pd.DataFrame = pd.read_csv(clinical_file, header=0, dtype=str, low_memory=False)
             except pd.errors.ParserError:
-                self.clinical_data = pd.read_csv(clinical_file, header=0, sep='\t', low_memory=False).astype(str)
+                self.clinical_data = pd.read_csv(clinical_file, header=0, sep='\t', dtype=str, low_memory=False)
 
             self.clinical_data.fillna('', inplace=True)
             self.clinical_data = self.clinical_data.replace('nan', '')
@@ -9,8 +9,9 @@ from .umls_api import cui_search
 
 __all__ = ['gets_ontology_statistics', 'gets_ontology_classes', 'gets_ontology_class_labels',
            'gets_ontology_class_labels', 'gets_ontology_class_definitions', 'gets_ontology_class_synonyms',
-           'gets_ontology_class_dbxrefs', 'gets_deprecated_ontology_classes', 'cui_search', 'data_frame_subsetter',
-           'data_frame_supersetter', 'column_splitter', 'aggregates_column_values', 'data_frame_grouper',
-           'normalizes_source_codes', 'merge_dictionaries', 'ohdsi_ananke', 'normalizes_clinical_source_codes',
-           'filters_mapping_content', 'compiles_mapping_content', 'formats_mapping_evidence',
-           'assigns_mapping_category', 'aggregates_mapping_results']
+           'gets_ontology_class_dbxrefs', 'gets_deprecated_ontology_classes', 'cui_search', 'reads_string_data',
+           'data_frame_subsetter', 'data_frame_supersetter', 'column_splitter', 'aggregates_column_values',
+           'data_frame_grouper', 'normalizes_source_codes', 'merges_sorted_keys', 'merge_dictionaries',
+           'stacks_dictionaries', 'ohdsi_ananke', 'normalizes_clinical_source_codes', 'filters_mapping_content',
+           'compiles_mapping_content', 'formats_mapping_evidence', 'assigns_mapping_category',
+           'aggregates_mapping_results']
@@ -5,15 +5,18 @@
 Data PreProcessing Utility Functions.
 
 Pandas DataFrame manipulations
+* reads_string_data
 * data_frame_subsetter
 * data_frame_supersetter
 * column_splitter
 * aggregates_column_values
 * data_frame_grouper
 * normalizes_source_codes
+* merges_sorted_keys
 
 Dictionary manipulations
 * merge_dictionaries
+* stacks_dictionaries
 
 Mapping Result Aggregation
 * ohdsi_ananke
@@ -27,11 +30,14 @@ Mapping Result Aggregation
 """
 
 # import needed libraries
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
+import pyarrow as pa  # type: ignore
 import re
 
 from functools import reduce
 from more_itertools import unique_everseen
+from pyarrow import csv as pacsv  # type: ignore
 from tqdm import tqdm  # type: ignore
 from typing import Any, Callable, Dict, List, Optional, Tuple  # type: ignore
 
@@ -41,6 +47,35 @@ from typing import Any, Callable, Dict, List, Optional, Tuple  # type: ignore
 pd.options.mode.chained_assignment = None
 
 
+def reads_string_data(file_path: str, delimiter: str = ',') -> pd.DataFrame:
+    """Reads a delimited file with a header row into a Pandas DataFrame where every column is parsed as a string. The
+    file is parsed by the multi-threaded Arrow CSV reader and, because all column types are declared up front, no type
+    inference or casting of the parsed columns is needed. Missing values are returned as the string "nan", matching
+    the result of casting a Pandas DataFrame with astype(str). Unlike pd.read_csv(...).astype(str), values keep their
+    raw text, so numeric columns keep leading zeros and integers are not turned into floats (e.g. "00123" is returned
+    as "00123", not "123" or "123.0").
+
+    Args:
+        file_path: A string containing the file path to the delimited file.
+        delimiter: A string specifying the delimiter type (default=',').
+
+    Returns:
+        A Pandas DataFrame containing the data from the input file.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the file cannot be parsed using the input delimiter.
+    """
+
+    # quoted values may span lines (e.g. multi-line labels), which must not be split at a read block boundary
+    parse_options = pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True)
+    columns = pacsv.open_csv(file_path, parse_options=parse_options).schema.names
+    convert_options = pacsv.ConvertOptions(column_types={col: pa.string() for col in columns},
+                                           strings_can_be_null=True)
+    data = pacsv.read_csv(file_path, parse_options=parse_options, convert_options=convert_options).to_pandas()
+
+    return data.fillna('nan')
+
+
 def data_frame_subsetter(data: pd.DataFrame, primary_key: str, subset_columns: List) -> pd.DataFrame:
     """Takes a Pandas DataFrame and subsets it such that each subset represents an original column of codes, OMOP
     concept identifiers, and a string containing the code's column name in the original DataFrame. An example of
@@ -137,17 +172,12 @@ def column_splitter(data: pd.DataFrame, key: str, delimited_columns: List, delim
     for col in delimited_columns:
         subset_data = data[[key, col]]
 
-        # expand delimited column
-        split_data = subset_data[col].str.split(delimiter).apply(pd.Series, 1).stack()
-        split_data.index = split_data.index.droplevel(-1)
-        split_data.name = col
+        # expand delimited column and clean up leading and trailing white space
+        split_data = subset_data[col].str.split(delimiter).explode().str.strip()
 
         # drop original delimited column and merge expanded data
         subset_data.drop(columns=[col], inplace=True)
         merged_split_data = subset_data.join(split_data)
-
-        # clean up leading and trailing white space
-        merged_split_data[col] = merged_split_data[col].apply(lambda x: x.strip())
         delimited_data.append(merged_split_data.drop_duplicates())
 
     # merge delimited data
@@ -253,28 +283,69 @@ def normalizes_source_codes(data: pd.DataFrame, source_code_dict: Dict) -> pd.Se
 
     Returns:
         A Pandas Series that has been normalized.
+
+    Raises:
+        ValueError: If the column to normalize contains missing values.
     """
 
-    # split prefix from number in each identifier
-    prefix = data[data.columns[0]].apply(
-        lambda j: j.rstrip([x for x in re.split('[_:|/]', j) if x != ''][-1])[:-1] if 'http' in j and '_' in j else
-        j.rstrip([x for x in re.split('[:|/]', j) if x != ''][-1])[:-1]
-    )
+    if data[data.columns[0]].isna().any():
+        raise ValueError('Column {} contains missing identifiers, which cannot be normalized.'.format(data.columns[0]))
 
-    id_num = data[data.columns[0]].apply(
-        lambda j: [x for x in re.split('[_:|/]', j) if x != ''][-1] if 'http' in j and '_' in j else
-        [x for x in re.split('[:|/]', j) if x != ''][-1]
-    ).str.lower()
+    # factorize identifiers so that each distinct identifier is only normalized once
+    codes, identifiers = pd.factorize(data[data.columns[0]])
 
-    # normalize prefix to dictionary and clean up urls
-    norm_prefix = prefix.apply(lambda j: source_code_dict[j] if j in source_code_dict.keys() else j)
+    normalized_identifiers = []
+    for j in identifiers:
+        # split prefix from number in identifier
+        id_num = [x for x in re.split('[_:|/]' if 'http' in j and '_' in j else '[:|/]', j) if x != ''][-1]
+        prefix = j.rstrip(id_num)[:-1]
+        # normalize prefix to dictionary, clean up urls, and concat normalized identifier and number back together
+        normalized_identifiers.append(source_code_dict.get(prefix, prefix) + ':' + id_num.lower())
 
-    # concat normalized identifier and number back together
-    updated_source_codes = norm_prefix + ':' + id_num
+    updated_source_codes = pd.Series(np.array(normalized_identifiers, dtype=object)[codes], index=data.index,
+                                     name=data.columns[0])
 
     return updated_source_codes
 
 
+def merges_sorted_keys(left: pd.DataFrame, left_on: str, right: pd.DataFrame) -> pd.DataFrame:
+    """Inner merges a column of a Pandas DataFrame with the sorted categorical index of a second Pandas DataFrame.
+    Since the index is sorted by its category codes, the block of matching right rows for each left row is found with
+    a binary search of the codes (np.searchsorted) and the rows are expanded with np.repeat, so no hash table needs to
+    be built. Like pd.merge(left, right, how='inner', left_on=left_on, right_index=True), the output keeps the order
+    of the left rows and, within each left row, the order of the matching right rows.
+
+    Args:
+        left: A Pandas DataFrame.
+        left_on: A string containing the name of the left column to merge on.
+        right: A Pandas DataFrame with a sorted CategoricalIndex; its columns must not overlap with those of left.
+
+    Returns:
+        A Pandas DataFrame containing the columns of left followed by the columns of right for each matching pair.
+
+    Raises:
+        ValueError: If the index of right is not sorted.
+    """
+
+    # the binary search is only valid on sorted keys, an unsorted index would silently drop matches
+    if not right.index.is_monotonic_increasing:
+        raise ValueError('The index of right must be sorted before merging.')
+
+    right_keys = right.index.codes
+    left_keys = pd.Categorical(left[left_on], categories=right.index.categories).codes
+
+    # each left key matches the block of right rows between its left- and right-most insertion points
+    begin = np.searchsorted(right_keys, left_keys, side='left')
+    counts = np.searchsorted(right_keys, left_keys, side='right') - begin
+    counts[left_keys == -1] = 0
+    left_rows = np.repeat(np.arange(len(left)), counts)
+    right_rows = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - begin, counts)
+    merged_data = pd.concat([left.iloc[left_rows].reset_index(drop=True),
+                             right.iloc[right_rows].reset_index(drop=True)], axis=1)
+
+    return merged_data
+
+
 def merge_dictionaries(dictionaries: Dict, key_type: str, reverse: bool = False) -> Dict:
     """Given any number of dictionaries, shallow copy and merge into a new dict, precedence goes to key value pairs
     in latter dictionaries.
@@ -302,6 +373,28 @@ def merge_dictionaries(dictionaries: Dict, key_type: str, reverse: bool = False)
     return combined_dictionary
 
 
+def stacks_dictionaries(dictionaries: Dict, key_types: List, columns: List) -> pd.DataFrame:
+    """Takes a nested dictionary and stacks the key-value pairs of the inner dictionaries for each of the key types
+    into a single two-column Pandas DataFrame. Each inner dictionary is converted to an Arrow table and the tables are
+    concatenated before converting them to Pandas once, avoiding the creation of an intermediate merged dictionary.
+
+    Args:
+        dictionaries: A nested dictionary.
+        key_types: A list of strings containing the keys of the inner dictionaries to stack (e.g. ['label', 'synonym']).
+        columns: A list of two strings, the column names for the inner dictionary keys and values, respectively.
+
+    Returns:
+        A Pandas DataFrame containing one row for each key-value pair in the selected inner dictionaries.
+    """
+
+    schema = pa.schema([(col, pa.string()) for col in columns])
+    tables = [pa.Table.from_pydict({columns[0]: list(dictionaries[dictionary][key_type].keys()),
+                                    columns[1]: list(dictionaries[dictionary][key_type].values())}, schema=schema)
+              for dictionary in dictionaries.keys() for key_type in key_types]
+
+    return pa.concat_tables(tables).to_pandas() if len(tables) > 0 else pd.DataFrame(columns=columns)
+
+
 def ohdsi_ananke(primary_key: str, ont_keys: list, ont_data: pd.DataFrame, data1: pd.DataFrame, data2: pd.DataFrame) \
         -> pd.DataFrame:
     """Function applies logic from the OHDSIAnanake method to extend data1, which contains dbxref mappings to OMOP
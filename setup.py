@@ -73,6 +73,8 @@ setup(
         'oauth2client==4.1.3',
         'openpyxl==3.0.5',
         'pandas==1.1.5',
+        'pyarrow==2.0.0',
+        'rapidfuzz==2.0.0',
         'rdflib==5.0.0',
         'regex==2020.11.13',
         'responses==0.10.12',
@@ -3,6 +3,7 @@
 
 import os.path
 import pickle
+import tempfile
 
 from unittest import TestCase
 
@@ -96,6 +97,16 @@ class TestConceptAnnotator(TestCase):
                           self.concept_codes, self.concept_strings, self.ancestor_codes, self.ancestor_strings,
                           self.umls_cui, self.umls_tui, True, self.source_codes)
 
+        # test if file is tab-delimited
+        with tempfile.TemporaryDirectory() as temp_directory:
+            clinical_file_tab = temp_directory + '/sample_omop_condition_occurrence_data_tab.txt'
+            self.annotator.clinical_data.to_csv(clinical_file_tab, sep='\t', index=False)
+            annotator = ConceptAnnotator(clinical_file_tab, self.ont_dict, self.primary_key, self.concept_codes,
+                                         self.concept_strings, self.ancestor_codes, self.ancestor_strings,
+                                         self.umls_cui, self.umls_tui, True, self.source_codes)
+            self.assertEqual(annotator.clinical_data.shape, self.annotator.clinical_data.shape)
+            self.assertEqual(list(annotator.clinical_data.columns), list(self.annotator.clinical_data.columns))
+
         return None
 
     def test_initialization_ontology_dict(self):
@@ -106,6 +117,10 @@ class TestConceptAnnotator(TestCase):
                           self.concept_strings, self.ancestor_codes, self.ancestor_strings, self.umls_cui,
                           self.umls_tui, True, self.source_codes)
 
+        # check that ontology dbxrefs are prepared for merging
+        self.assertEqual(list(self.annotator.ont_dbxref_data.columns), ['CODE', 'DBXREF_URI'])
+        self.assertFalse(self.annotator.ont_dbxref_data.duplicated().any())
+
         return None
 
     def test_initialization_primary_key(self):
@@ -240,6 +255,7 @@ class TestConceptAnnotator(TestCase):
         umls_annotated_data = self.annotator.umls_cui_annotator(data, 'CONCEPT_ID', 'CONCEPT_SOURCE_CODE')
         self.assertTrue(len(umls_annotated_data) == 66)
         self.assertTrue(len(umls_annotated_data.columns) == 6)
+        self.assertFalse(umls_annotated_data.duplicated().any())
         self.assertEqual(umls_annotated_data.at[0, 'UMLS_SEM_TYPE'], 'Amino Acid, Peptide, or Protein')
 
         return None
@@ -259,10 +275,30 @@ class TestConceptAnnotator(TestCase):
         umls_annotated_data = self.annotator.umls_cui_annotator(data, 'CONCEPT_ID', 'CONCEPT_SOURCE_CODE')
         self.assertTrue(len(umls_annotated_data) == 3)
         self.assertTrue(len(umls_annotated_data.columns) == 6)
+        self.assertFalse(umls_annotated_data.duplicated().any())
         self.assertEqual(umls_annotated_data.at[0, 'UMLS_SEM_TYPE'], 'Amino Acid, Peptide, or Protein')
 
         return None
 
+    def test_umls_cui_lookup(self):
+        """Tests the umls_cui_lookup method."""
+
+        # get a code from the umls data
+        code = self.annotator.umls_cui_data['CODE'].iloc[0]
+        cuis = self.annotator.umls_cui_data.loc[self.annotator.umls_cui_data['CODE'] == code, 'CUI'].tolist()
+
+        # test method -- the lookup dictionary is only built on the first call
+        self.assertIsNone(self.annotator.umls_code_cuis)
+        self.assertEqual(sorted(self.annotator.umls_cui_lookup(code)), sorted(cuis))
+        self.assertIsInstance(self.annotator.umls_code_cuis, dict)
+        self.assertEqual(self.annotator.umls_cui_lookup('fake:0000000'), [])
+
+        # test method without umls data
+        self.annotator.umls_cui_data, self.annotator.umls_code_cuis = None, None
+        self.assertEqual(self.annotator.umls_cui_lookup(code), [])
+
+        return None
+
     def test_dbxref_mapper(self):
         """Tests the dbxref_mapper method."""
 
@@ -307,6 +343,36 @@ class TestConceptAnnotator(TestCase):
 
         return None
 
+    def test_similarity_string_mapper(self):
+        """Tests the similarity_string_mapper method."""
+
+        # prepare input data
+        primary_key, code_strings = 'CONCEPT_ID', ['CONCEPT_LABEL', 'CONCEPT_SYNONYM']
+        clinical_strings = self.annotator.clinical_data.copy()[[primary_key] + code_strings]
+        split_strings = column_splitter(clinical_strings, primary_key, code_strings, '|')
+        split_strings = split_strings[[primary_key] + code_strings]
+        split_strings_stacked = data_frame_subsetter(split_strings, primary_key, code_strings)
+
+        # test method with default threshold
+        stacked_strings = self.annotator.similarity_string_mapper(split_strings_stacked, 'CONCEPT_ID', 'concept')
+        self.assertTrue(len(stacked_strings) == 2)
+        self.assertEqual(list(stacked_strings.columns), ['CONCEPT_ID', 'CONCEPT_SIM_ONT_URI', 'CONCEPT_SIM_ONT_TYPE',
+                                                         'CONCEPT_SIM_ONT_LABEL', 'CONCEPT_SIM_ONT_EVIDENCE'])
+
+        # test method with lower threshold
+        stacked_strings = self.annotator.similarity_string_mapper(split_strings_stacked, 'CONCEPT_ID', 'concept', 0.6)
+        self.assertTrue(len(stacked_strings) == 6)
+        self.assertIn('CONCEPT_LABEL:tumor_of_conjunctiva_0.762', list(stacked_strings['CONCEPT_SIM_ONT_EVIDENCE']))
+
+        # test method when there are no ontology strings
+        self.annotator.ont_string_data = self.annotator.ont_string_data.iloc[0:0]
+        stacked_strings = self.annotator.similarity_string_mapper(split_strings_stacked, 'CONCEPT_ID', 'concept')
+        self.assertTrue(len(stacked_strings) == 0)
+        self.assertEqual(list(stacked_strings.columns), ['CONCEPT_ID', 'CONCEPT_SIM_ONT_URI', 'CONCEPT_SIM_ONT_TYPE',
+                                                         'CONCEPT_SIM_ONT_LABEL', 'CONCEPT_SIM_ONT_EVIDENCE'])
+
+        return None
+
     def test_clinical_concept_mapper(self):
         """Tests the clinical_concept_mapper method."""
 
@@ -317,6 +383,26 @@ class TestConceptAnnotator(TestCase):
 
         return None
 
+    def test_clinical_concept_mapper_no_umls_expand(self):
+        """Tests the clinical_concept_mapper method when UMLS CUIs are only merged once."""
+
+        # change input parameters
+        self.annotator.umls_double_merge = False
+
+        # test method
+        results = self.annotator.clinical_concept_mapper()
+        self.assertTrue(len(results) == 4)
+        self.assertTrue(len(results.columns) == 30)
+        self.assertIn('CONCEPT_DBXREF_HP_EVIDENCE', results.columns)
+
+        # test method without ancestors
+        self.annotator.ancestor_codes = None
+        results = self.annotator.clinical_concept_mapper()
+        self.assertTrue(len(results) == 4)
+        self.assertTrue(len(results.columns) == 19)
+
+        return None
+
     def test_clinical_concept_mapper_no_umls(self):
         """Tests the clinical_concept_mapper method when no MRCONSO or MRSTY data are provided."""
 
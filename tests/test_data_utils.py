@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os.path
 import pandas as pd
+import tempfile
 import unittest
 
 from typing import Dict, Tuple
@@ -94,6 +96,38 @@ class TestDataUtils(unittest.TestCase):
 
         return None
 
+    def test_reads_string_data(self):
+        """Tests the reads_string_data method."""
+
+        # run method and test output
+        file_path = os.path.dirname(__file__) + '/data/clinical_data/sample_omop_condition_occurrence_data2.csv'
+        data = reads_string_data(file_path)
+        self.assertIsInstance(data, pd.DataFrame)
+        self.assertEqual(data.shape, (5, 11))
+        self.assertTrue(all(x == object for x in data.dtypes))
+        self.assertEqual(data.at[0, 'CONCEPT_ID'], '132342')
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            # test that numeric values keep their raw text
+            numeric_file_path = temp_directory + '/sample_numeric_codes.csv'
+            pd.DataFrame({'CONCEPT_ID': ['00123', '45'], 'CODE': ['1', '']}).to_csv(numeric_file_path, index=False)
+            data = reads_string_data(numeric_file_path)
+            self.assertEqual(list(data['CONCEPT_ID']), ['00123', '45'])
+            self.assertEqual(list(data['CODE']), ['1', 'nan'])
+
+            # test that quoted values with newlines are kept intact in files larger than a single read block
+            multiline_file_path = temp_directory + '/sample_multiline_labels.csv'
+            multiline_data = pd.DataFrame({'CONCEPT_ID': [str(x) for x in range(60000)],
+                                           'CONCEPT_LABEL': 'label\nsecond line, with comma'})
+            multiline_data['CONCEPT_SOURCE_CODE'] = 'snomed:' + multiline_data['CONCEPT_ID']
+            multiline_data.to_csv(multiline_file_path, index=False)
+            data = reads_string_data(multiline_file_path)
+            self.assertEqual(data.shape, (60000, 3))
+            self.assertEqual(list(data['CONCEPT_ID']), list(multiline_data['CONCEPT_ID']))
+            self.assertTrue((data['CONCEPT_LABEL'] == 'label\nsecond line, with comma').all())
+
+        return None
+
     def test_data_frame_subsetter(self):
         """Tests the data_frame_subsetter method."""
 
@@ -180,6 +214,10 @@ class TestDataUtils(unittest.TestCase):
         self.assertIn('snomed:111395007', list(result))
         self.assertIn('pesticides:derivatives:benazolin-ethyl', list(result))
 
+        # test method when identifiers are missing
+        data = pd.DataFrame(['snomedct_us:111395007', None, 'reactome:r-hsa-937045'], columns=['CODE'])
+        self.assertRaises(ValueError, normalizes_source_codes, data['CODE'].to_frame(), source_code_dict)
+
         return None
 
     def test_merge_dictionaries(self):
@@ -199,6 +237,54 @@ class TestDataUtils(unittest.TestCase):
 
         return None
 
+    def test_merges_sorted_keys(self):
+        """Tests the merges_sorted_keys method."""
+
+        # create input data
+        left = pd.DataFrame({'ID': ['1', '2', '3', '4'], 'KEY': ['c', 'a', 'z', 'a']})
+        right = pd.DataFrame({'KEY': ['a', 'a', 'b', 'c'], 'VALUE': ['a1', 'a2', 'b1', 'c1']})
+        right = right.astype({'KEY': 'category'})
+        right = right.set_index('KEY', drop=False).sort_index()
+
+        # run method and test output
+        merged_data = merges_sorted_keys(left, 'KEY', right.rename(columns={'KEY': 'RIGHT_KEY'}))
+        expected = left.merge(right.drop(columns='KEY'), how='inner', left_on='KEY', right_index=True)
+        self.assertIsInstance(merged_data, pd.DataFrame)
+        self.assertEqual(list(merged_data.columns), ['ID', 'KEY', 'RIGHT_KEY', 'VALUE'])
+        self.assertEqual(list(merged_data['ID']), list(expected['ID']))
+        self.assertEqual(list(merged_data['VALUE']), list(expected['VALUE']))
+        self.assertTrue((merged_data['KEY'] == merged_data['RIGHT_KEY'].astype(str)).all())
+
+        # test the method when there are no matching keys
+        merged_data = merges_sorted_keys(left[left['KEY'] == 'z'], 'KEY', right.rename(columns={'KEY': 'RIGHT_KEY'}))
+        self.assertTrue(len(merged_data) == 0)
+
+        # test the method when the right index is not sorted
+        unsorted_right = pd.DataFrame({'VALUE': ['b1', 'a1', 'b2']}, index=pd.CategoricalIndex(['b', 'a', 'b']))
+        self.assertRaises(ValueError, merges_sorted_keys, left, 'KEY', unsorted_right)
+
+        return None
+
+    def test_stacks_dictionaries(self):
+        """Tests the stacks_dictionaries method."""
+
+        # run method and test output
+        stacked_dicts = stacks_dictionaries(self.sample_dicts, ['dbxref'], ['CODE', 'URI'])
+        self.assertIsInstance(stacked_dicts, pd.DataFrame)
+        self.assertEqual(list(stacked_dicts.columns), ['CODE', 'URI'])
+        self.assertTrue(len(stacked_dicts) == 6)
+
+        # test the method with several key types
+        stacked_dicts = stacks_dictionaries(self.sample_dicts, ['dbxref', 'label'], ['CODE', 'URI'])
+        self.assertTrue(len(stacked_dicts) == 12)
+
+        # test the method when there are no dictionaries to stack
+        stacked_dicts = stacks_dictionaries({}, ['dbxref'], ['CODE', 'URI'])
+        self.assertEqual(list(stacked_dicts.columns), ['CODE', 'URI'])
+        self.assertTrue(len(stacked_dicts) == 0)
+
+        return None
+
     def test_ohdsi_ananke(self):
         """Tests the ohdsi_ananke method."""
 